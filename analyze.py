@@ -14,22 +14,24 @@
 # the License.
 
 import argparse
+import atexit
+import bisect
 import logging
 import os
 import textwrap
 import json
 import glob
+import itertools
 import subprocess
 import shutil
 import sys
 import tempfile
 
-from typing import Iterable, Set, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Any, Optional, Tuple
 from datetime import datetime
-from io import StringIO
 
 import pandas as pd
-import pytz
 import altair as alt  # type: ignore
 
 
@@ -59,9 +61,11 @@ OUTDIR: Optional[str] = None
 # ARGS: Optional[argparse.Namespace] = None
 ARGS: Any = None
 
-# Individual code sections are supposed to add to this in-memory Markdown
-# document as they desire.
-MD_REPORT = StringIO()
+# Individual code sections are supposed to add to this Markdown document as
+# they desire. This is a file object (opened in main(), once the output
+# directory is known), i.e. the document is streamed to disk instead of being
+# accumulated in memory.
+MD_REPORT: Any = None
 JS_FOOTER_LINES: list[str] = []
 
 # https://github.com/vega/vega-embed#options -- use SVG renderer so that PDF
@@ -82,6 +86,7 @@ DATETIME_AXIS_PROPERTIES = {
 def main() -> None:
     parse_args()
     configure_altair()
+    open_md_report()
 
     df_stargazers = read_stars_over_time_from_csv()
     df_forks = read_forks_over_time_from_csv()
@@ -222,14 +227,36 @@ def report_pdf_pagebreak():
     MD_REPORT.write('\n\n<div class="pagebreak-for-print"> </div>\n\n')
 
 
-def finalize_and_render_report():
+def open_md_report():
+    global MD_REPORT
     md_report_filepath = os.path.join(OUTDIR, f"{ARGS.outfile_prefix}report.md")
     log.info("Write generated Markdown report to: %s", md_report_filepath)
-    with open(md_report_filepath, "wb") as f:
-        f.write(MD_REPORT.getvalue().encode("utf-8"))
+    MD_REPORT = open(md_report_filepath, "w", encoding="utf-8")
+    # Do not leave a truncated report behind when terminating before
+    # finalize_and_render_report() (e.g. via sys.exit() upon bad input data).
+    atexit.register(_remove_unfinished_md_report)
+
+
+def _remove_unfinished_md_report():
+    if MD_REPORT.closed:
+        return
+    MD_REPORT.close()
+    log.info("Remove unfinished Markdown report: %s", MD_REPORT.name)
+    os.unlink(MD_REPORT.name)
+
+
+def finalize_and_render_report():
+    # Flush remaining buffered content to disk before pandoc reads the file.
+    md_report_filepath = MD_REPORT.name
+    MD_REPORT.close()
+    log.info("Markdown report written: %s", md_report_filepath)
 
     log.info("Copy resources directory into output directory")
-    shutil.copytree(ARGS.resources_directory, os.path.join(OUTDIR, "resources"))
+    shutil.copytree(
+        ARGS.resources_directory,
+        os.path.join(OUTDIR, "resources"),
+        copy_function=_link_or_copy,
+    )
 
     # As of the time of writing, the `resources` source directory contains a
     # CSS file which must be part of the output -- and a template.html file
@@ -255,6 +282,18 @@ def finalize_and_render_report():
     os.unlink(html_template_filepath)
 
 
+def _link_or_copy(src, dst):
+    # The resource files are static. Create a hard link instead of copying
+    # file contents. That fails e.g. across file systems: fall back to a
+    # regular copy then.
+    try:
+        os.link(src, dst)
+    except OSError as e:
+        log.debug("hard link failed (%s), copy %s instead", e, src)
+        shutil.copy2(src, dst)
+    return dst
+
+
 def run_pandoc(md_report_filepath, html_template_filepath, html_output_filepath):
 
     pandoc_cmd = [
@@ -378,47 +417,73 @@ def top_x_snapshots_rename_columns(df):
         pass
 
 
-def _get_snapshot_time_from_path(p, basename_suffix):
+def _get_snapshot_times_from_paths(csvpaths, basename_suffix) -> pd.DatetimeIndex:
     # Expect each filename (basename) to have a prefix of format
-    # %Y-%m-%d_%H%M%S encoding the snapshot time (in UTC). Isolate that as
-    # tz-aware datetime object, return.
-    basename_prefix = os.path.basename(p).split(basename_suffix)[0]
-    t = pytz.timezone("UTC").localize(
-        datetime.strptime(basename_prefix, "%Y-%m-%d_%H%M%S")
-    )
-    log.debug("parsed timestamp from path: %s", t)
-    return t
+    # %Y-%m-%d_%H%M%S encoding the snapshot time (in UTC). Isolate these
+    # prefixes and parse them all with one vectorized call. Return tz-aware
+    # timestamps, in the same order as `csvpaths`.
+    basename_prefixes = [
+        os.path.basename(p).split(basename_suffix)[0] for p in csvpaths
+    ]
+    times = pd.to_datetime(basename_prefixes, format="%Y-%m-%d_%H%M%S", utc=True)
+    log.debug("parsed timestamps from paths: %s", times)
+    return times
+
+
+def _read_csv_files(csvpaths, **read_csv_kwargs) -> list[pd.DataFrame]:
+    # pandas' C parser releases the GIL while tokenizing. There may be
+    # hundreds of (small) snapshot CSV files: parse them concurrently, in a
+    # thread pool. Return dataframes in the same order as `csvpaths`.
+    def _read(p):
+        log.info("attempt to parse %s", p)
+        try:
+            return pd.read_csv(p, **read_csv_kwargs)
+        except Exception as e:
+            # The exception is re-raised in the main thread, w/o reference to
+            # the file. Name the file here.
+            log.error("could not parse %s: %s", p, e)
+            raise
+
+    with ThreadPoolExecutor() as executor:
+        return list(executor.map(_read, csvpaths))
 
 
 def _get_snapshot_dfs(csvpaths, basename_suffix):
 
     snapshot_dfs = []
-    column_names_seen = set()
+    columns_seen: Optional[pd.Index] = None
 
-    log.info(f"about to deserialize {len(csvpaths)} snapshot CSV files")
+    log.info("about to deserialize %s snapshot CSV files", len(csvpaths))
 
-    for p in csvpaths:
-        log.debug("attempt to parse %s", p)
-        snapshot_time = _get_snapshot_time_from_path(p, basename_suffix)
-        df = pd.read_csv(p)
+    snapshot_times = _get_snapshot_times_from_paths(csvpaths, basename_suffix)
 
+    # Only the unique view count is analyzed for top referrers/paths. Do not
+    # tokenize/allocate the total view count column (name depends on the age
+    # of the CSV file, see top_x_snapshots_rename_columns()).
+    dfs = _read_csv_files(
+        csvpaths, usecols=lambda c: c not in ("views_total", "count_total")
+    )
+
+    for p, snapshot_time, df in zip(csvpaths, snapshot_times, dfs):
         # mutate column names in-place.
         top_x_snapshots_rename_columns(df)
 
         # attach snapshot time as meta data prop to df
         df.attrs["snapshot_time"] = snapshot_time
 
-        # Add new column to each dataframe: `time`, with the same value for
-        # every row: the snapshot time.
-        df["time"] = snapshot_time
-
-        if column_names_seen and set(df.columns) != column_names_seen:
-            log.error("columns seen so far: %s", column_names_seen)
+        # Expect the same columns, in the same order, in all files: do the
+        # cheap `Index.equals()` check first, compare as sets only upon
+        # mismatch.
+        if columns_seen is None:
+            columns_seen = df.columns
+        elif not df.columns.equals(columns_seen) and set(df.columns) != set(
+            columns_seen
+        ):
+            log.error("columns seen so far: %s", columns_seen)
             log.error("columns in %s: %s", p, df.columns)
             log.error("inconsistent set of column names across CSV files")
             sys.exit(1)
 
-        column_names_seen.update(df.columns)
         snapshot_dfs.append(df)
 
     return snapshot_dfs
@@ -428,18 +493,14 @@ def _build_entity_dfs(dfa, entity_type, unique_entity_names):
 
     cmn_ename_prefix = os.path.commonprefix(list(unique_entity_names))
     log.info("_build_entity_dfs. cmn_ename_prefix: %s", cmn_ename_prefix)
-    log.info("dfa:\n%s", dfa)
+    log.debug("dfa:\n%s", dfa)
 
     entity_dfs = {}
-    for ename in unique_entity_names:
-        # Do a subselection
-        edf = dfa[dfa[entity_type] == ename]
+    # Partition `dfa` by entity name in a single pass (instead of doing a
+    # full-length boolean mask comparison for each individual entity).
+    for ename, edf in dfa.groupby(entity_type, sort=False):
         # Now use datetime column as index
-        newindex = edf["time"]
-        edf = edf.drop(columns=["time"])
-
-        edf.index = newindex
-        edf = edf.sort_index()
+        edf = edf.set_index("time").sort_index()
 
         # Do entity name processing
         log.debug("ename before transformation: %s", ename)
@@ -468,9 +529,10 @@ def _build_entity_dfs(dfa, entity_type, unique_entity_names):
         edf = edf.resample(f"{n_hour_bins}h").max().dropna()
         # log.debug("len(edf): %s", len(edf))
 
-        # print(edf)
         entity_dfs[ename] = edf
-        log.info(f"created dataframe for {entity_type}: {ename} -- len: {len(edf)}")
+        log.info(
+            "created dataframe for %s: %s -- len: %s", entity_type, ename, len(edf)
+        )
 
     return entity_dfs
 
@@ -494,36 +556,39 @@ def analyse_top_x_snapshots(entity_type, date_axis_lim):
     csvpaths = _glob_csvpaths(basename_suffix)
     snapshot_dfs = _get_snapshot_dfs(csvpaths, basename_suffix)
 
-    # for df in snapshot_dfs:
-    #     print(df)
-
-    # Keep in mind: an entity_type is either a top 'referrer', or a top 'path'.
-    # Find all entities seen across snapshots, by their name. For type referrer
-    # a specific entity(referrer) name might be `github.com`.
-
-    def _get_uens(snapshot_dfs):
-        unique_entity_names = set()
-        for df in snapshot_dfs:
-            unique_entity_names.update(df[entity_type].values)
-
-        return unique_entity_names
-
-    unique_entity_names = _get_uens(snapshot_dfs)
-    log.info("all %s entities seen: %s", entity_type, unique_entity_names)
-
     # Clarification: each snapshot dataframe corresponds to a single point in
     # time (the snapshot time) and contains information about multiple top
     # referrers/paths. Now, invert that structure: work towards individual
     # dataframes where each dataframe corresponds to a single referrer/path,
     # and contains imformation about multiple timestamps
 
-    # First, create a dataframe containing all information.
-    dfa = pd.concat(snapshot_dfs)
+    # First, create a dataframe containing all information. Add a `time`
+    # column: for each row the time of the snapshot that the row came from.
+    # Use the concat() keys mechanism for that (builds the column in one go,
+    # instead of adding a column to each individual snapshot dataframe).
+    dfa = pd.concat(
+        snapshot_dfs,
+        keys=[df.attrs["snapshot_time"] for df in snapshot_dfs],
+        names=["time"],
+        copy=False,
+    ).reset_index(level=0)
 
     if len(dfa) == 0:
         log.info("leave early: no data for entity of type %s", entity_type)
         return
 
+    # Keep in mind: an entity_type is either a top 'referrer', or a top 'path'.
+    # Find all entities seen across snapshots, by their name. For type referrer
+    # a specific entity(referrer) name might be `github.com`.
+    unique_entity_names = pd.unique(dfa[entity_type])
+    # There may be many: do not stringify all of them for the log.
+    log.info(
+        "%s entities seen: %s, first 20: %s",
+        entity_type,
+        len(unique_entity_names),
+        list(unique_entity_names[:20]),
+    )
+
     # Build a dict: key is path/referrer name, and value is DF with
     # corresponding raw time series.
     entity_dfs = _build_entity_dfs(dfa, entity_type, unique_entity_names)
@@ -546,25 +611,21 @@ def analyse_top_x_snapshots(entity_type, date_axis_lim):
     # One interesting way to look at the data: find the top 5 referrers based
     # on unique views, and for the entire time range seen.
 
-    max_vu_map = {}
-    for ename, edf in entity_dfs.items():
-        # TODO: do not pick max() value across time series for top-n
-        # consideration. That represents a peak, a single point in time which
-        # could be long ago. It's more meaningful to integerate over time,
-        # considering the entire time frame. That however might put a little
-        # too much weight on the past, too -- so maybe perform two
-        # integrations: entire time frame, and last three weeks. Build top N
-        # for both of these, and then merge.
-        max_vu_map[ename] = edf["views_unique"].max()
-    del ename, edf
-
-    # Sort dict so that the first item is the referrer/path with the highest
-    # views_unique seen.
-    sorted_dict = {
-        k: v for k, v in sorted(max_vu_map.items(), key=lambda i: i[1], reverse=True)
-    }
+    # TODO: do not pick max() value across time series for top-n
+    # consideration. That represents a peak, a single point in time which
+    # could be long ago. It's more meaningful to integerate over time,
+    # considering the entire time frame. That however might put a little
+    # too much weight on the past, too -- so maybe perform two
+    # integrations: entire time frame, and last three weeks. Build top N
+    # for both of these, and then merge.
+    max_vu = pd.Series(
+        {ename: edf["views_unique"].max() for ename, edf in entity_dfs.items()},
+        dtype="float64",
+    )
 
-    log.info(f"{entity_type}, highest views_unique seen: {sorted_dict}")
+    # Only the top N referrers/paths are of interest below: use nlargest()
+    # (partial selection) instead of sorting all of them.
+    log.info("%s, highest views_unique seen:\n%s", entity_type, max_vu.nlargest(15))
 
     # log.info(entity_dfs['linkedin.com'])
     # log.info(entity_dfs['vega.github.io'])
@@ -576,7 +637,7 @@ def analyse_top_x_snapshots(entity_type, date_axis_lim):
     # sys.exit()
 
     top_n = 7
-    top_n_enames = list(sorted_dict.keys())[:top_n]
+    top_n_enames = max_vu.nlargest(top_n).index.tolist()
 
     # Build individual views_unique over time series. These series might have
     # partially overlapping or non-overlapping datetime indices. Name these
@@ -645,7 +706,6 @@ def analyse_top_x_snapshots(entity_type, date_axis_lim):
     df_melted = df_top_vu.melt(
         var_name=entity_type, value_name="views_unique", ignore_index=False
     ).reset_index()
-    # print(df_melted)
 
     # Normalize main metric to show a view count _per day_, and clarify in the
     # plot that this is a _mean_ value derived from the _last 14 days_.
@@ -729,7 +789,7 @@ def analyse_top_x_snapshots(entity_type, date_axis_lim):
         .properties(**panel_props)
     )
 
-    chart_spec = chart.to_json(indent=None)
+    chart_spec = chart_spec_json(chart)
 
     # From
     # https://altair-viz.github.io/user_guide/customization.html
@@ -743,7 +803,7 @@ def analyse_top_x_snapshots(entity_type, date_axis_lim):
     # Textual form: larger N, and no cutoff (arbitrary length and legend of
     # plot don't go well with each other).
     top_n = 15
-    top_n_enames = list(sorted_dict.keys())[:top_n]
+    top_n_enames = max_vu.nlargest(top_n).index.tolist()
     top_n_enames_string_for_md = ", ".join(
         f"{str(i).zfill(2)}: `{n}`" for i, n in enumerate(top_n_enames, 1)
     )
@@ -777,18 +837,19 @@ def analyse_view_clones_ts_fragments() -> pd.DataFrame:
     csvpaths = _glob_csvpaths(basename_suffix)
 
     snapshot_dfs: list[pd.DataFrame] = []
-    column_names_seen: Set[str] = set()
-
-    for p in csvpaths:
-        log.info("attempt to parse %s", p)
-        snapshot_time = _get_snapshot_time_from_path(p, basename_suffix)
-
-        df = pd.read_csv(
-            p,
-            index_col=["time_iso8601"],
-            date_parser=lambda col: pd.to_datetime(col, utc=True),
-        )
-
+    snapshot_times: list[pd.Timestamp] = []
+    snapshot_paths: list[str] = []
+    columns_seen: Optional[pd.Index] = None
+
+    # Do not parse the timestamp column here: a `date_parser` callback is
+    # invoked for each file (and potentially for each row). Keep
+    # `time_iso8601` as string column for now, and parse timestamps for all
+    # fragments in one go after concatenation (see below).
+    dfs = _read_csv_files(csvpaths)
+
+    for p, snapshot_time, df in zip(
+        csvpaths, _get_snapshot_times_from_paths(csvpaths, basename_suffix), dfs
+    ):
         # Skip logic for empty data frames. The CSV files written should never
         # be empty, but if such a bad file made it into the file system then
         # skipping here facilitates debugging and enhanced robustness.
@@ -796,11 +857,47 @@ def analyse_view_clones_ts_fragments() -> pd.DataFrame:
             log.warning("empty dataframe parsed from %s, skip", p)
             continue
 
+        # See _get_snapshot_dfs(): cheap check first.
+        if columns_seen is None:
+            columns_seen = df.columns
+        elif not df.columns.equals(columns_seen) and set(df.columns) != set(
+            columns_seen
+        ):
+            log.error("columns seen so far: %s", columns_seen)
+            log.error("columns in %s: %s", p, df.columns)
+            sys.exit(1)
+
+        snapshot_dfs.append(df)
+        snapshot_times.append(snapshot_time)
+        snapshot_paths.append(p)
+
+    log.info("total sample count: %s", sum(len(df) for df in snapshot_dfs))
+
+    df_allsnapshots: Optional[pd.DataFrame] = None
+    if len(snapshot_dfs) == 0:
+        log.info("special case: no snapshots read for views/clones")
+    else:
+        newest_snapshot_time = max(snapshot_times)
+        log.info("time of newest snapshot: %s", newest_snapshot_time)
+
+        # combine all snapshots
+        log.info("pd.concat(snapshot_dfs)")
+        df_allsnapshots = pd.concat(snapshot_dfs, ignore_index=True)
+
+        # Parse all timestamps with a single vectorized call. `cache=True`:
+        # the same timestamp is expected to be contained in many fragments
+        # (overlapping time windows), i.e. there are many duplicate strings.
+        df_allsnapshots["time"] = pd.to_datetime(
+            df_allsnapshots["time_iso8601"], utc=True, cache=True
+        )
+        df_allsnapshots = df_allsnapshots.drop(columns=["time_iso8601"])
+        df_allsnapshots.set_index("time", inplace=True)
+
         # A time series fragment might look like this:
         #
         # df_views_clones:
         #                            clones_total  ...  views_unique
-        # time_iso8601                             ...
+        # time                                     ...
         # 2020-12-21 00:00:00+00:00           NaN  ...             2
         # 2020-12-22 00:00:00+00:00           2.0  ...            23
         # 2020-12-23 00:00:00+00:00           2.0  ...            20
@@ -814,52 +911,33 @@ def analyse_view_clones_ts_fragments() -> pd.DataFrame:
         # are expected to be present anywhere in this dataframe, and they
         # semantically mean "0". Therefore, replace those with zeros. Also see
         # https://github.com/jgehrcke/github-repo-stats/issues/4
-        df = df.fillna(0)
+        df_allsnapshots = df_allsnapshots.fillna(0)
         # Make sure numbers are treated as integers from here on. This actually
         # matters in a cosmetic way only for outputting the aggregate CSV later
         # #       # not for plotting and number crunching).
-        df = df.astype(int)
-
-        # attach snapshot time as meta data prop to df
-        df.attrs["snapshot_time"] = snapshot_time
-
-        # The index is not of string type anymore, but of type
-        # `pd.DatetimeIndex`. Reflect that in the name.
-        df.index.rename("time", inplace=True)
-
-        if column_names_seen and set(df.columns) != column_names_seen:
-            log.error("columns seen so far: %s", column_names_seen)
-            log.error("columns in %s: %s", p, df.columns)
-            sys.exit(1)
-
-        column_names_seen.update(df.columns)
-
-        df = df.sort_index()
+        df_allsnapshots = df_allsnapshots.astype(int)
 
         # Sanity check: snapshot time _after_ latest timestamp in time series?
         # This could hit in on a machine with a bad time setting when fetching
-        # data.
-        if df.index.max() > snapshot_time:
+        # data. Compare each sample against the snapshot time of the fragment
+        # it came from.
+        fragment_lengths = [len(df) for df in snapshot_dfs]
+        snapshot_time_per_sample = pd.DatetimeIndex(snapshot_times).repeat(
+            fragment_lengths
+        )
+        too_new = df_allsnapshots.index > snapshot_time_per_sample
+        if too_new.any():
+            # Map position of first offending sample to its fragment.
+            fragment_idx = bisect.bisect_right(
+                list(itertools.accumulate(fragment_lengths)), int(too_new.argmax())
+            )
             log.error(
                 "for CSV file %s the snapshot time %s is older than the newest sample",
-                p,
-                snapshot_time,
+                snapshot_paths[fragment_idx],
+                snapshot_times[fragment_idx],
             )
             sys.exit(1)
 
-        snapshot_dfs.append(df)
-
-    # for df in snapshot_dfs:
-    #     print(df)
-
-    log.info("total sample count: %s", sum(len(df) for df in snapshot_dfs))
-
-    if len(snapshot_dfs) == 0:
-        log.info("special case: no snapshots read for views/clones")
-    else:
-        newest_snapshot_time = max(df.attrs["snapshot_time"] for df in snapshot_dfs)
-        log.info("time of newest snapshot: %s", newest_snapshot_time)
-
     # Read previously created views/clones aggregate file if it exists.
     df_prev_agg = None
     if ARGS.views_clones_aggregate_inpath:
@@ -898,11 +976,7 @@ def analyse_view_clones_ts_fragments() -> pd.DataFrame:
     # are expected to be "the same" as in the snapshot taken the day before).
     # Stich these fragments together (with a buch of "duplicate samples), and
     # then sort this result by time.
-    if len(snapshot_dfs):
-        # combine all snapshots
-        log.info("pd.concat(snapshot_dfs)")
-        df_allsnapshots = pd.concat(snapshot_dfs)
-
+    if df_allsnapshots is not None:
         # Combine the result of combine-all-snapshots with previous aggregate
         dfall = df_allsnapshots
         if df_prev_agg is not None:
@@ -922,8 +996,13 @@ def analyse_view_clones_ts_fragments() -> pd.DataFrame:
 
     dfall.sort_index(inplace=True)
 
+    # View/clone counts are small non-negative integers. Use the narrowest
+    # unsigned integer type that can hold them: the max() aggregation below
+    # is memory-bound, and narrower columns mean fewer bytes to scan.
+    for c in dfall.columns:
+        dfall[c] = pd.to_numeric(dfall[c], downcast="unsigned")
+
     log.info("shape of dataframe before dropping duplicates: %s", dfall.shape)
-    # print(dfall)
 
     # Now, the goal is to drop duplicate data. And again, as of a lot of
     # overlap between snapshots there's a lot of duplicate data to be expected.
@@ -943,8 +1022,9 @@ def analyse_view_clones_ts_fragments() -> pd.DataFrame:
     # snapshot was taken. That is, for aggregation (for dropping duplicate/bad
     # data) we want to look for the maximum data value for any given timestamp.
     # Using that method, we effectively ignore said cutoff artifact. In short:
-    # group by timestamp (index), take the maximum.
-    df_agg: pd.DataFrame = dfall.groupby(dfall.index).max()
+    # group by timestamp (index), take the maximum. The index is sorted
+    # already (see above), i.e. there is no need for groupby() to sort again.
+    df_agg: pd.DataFrame = dfall.groupby(level=0, sort=False).max()
     log.info("shape of dataframe after dropping duplicates: %s", df_agg.shape)
 
     # Get time range, to be returned by this function. Used later for setting
@@ -986,8 +1066,6 @@ def analyse_view_clones_ts_fragments() -> pd.DataFrame:
                 except Exception as e:
                     log.warning("could not unlink %s: %s", p, str(e))
 
-    # print(df_agg)
-
     # matplotlib_config()
     # log.info("aggregated sample count: %s", len(df_agg))
     # df_agg.plot(
@@ -1008,9 +1086,14 @@ def analyse_view_clones_ts_fragments() -> pd.DataFrame:
     # Use new name for df to be kept around for returning, before reset_index()
     # so that df.index is kept meaningful.
     df_agg_for_return = df_agg
+    # Per-column value range, computed once for all charts below (y axis
+    # limits and scale type).
+    df_agg_range = df_agg.agg(["min", "max"])
     df_agg = df_agg.reset_index()
-    df_agg_views = df_agg.drop(columns=["clones_unique", "clones_total"])
-    df_agg_clones = df_agg.drop(columns=["views_unique", "views_total"])
+    # Column projections: each chart data set should contain only the columns
+    # relevant to it (Altair embeds all columns of the dataframe).
+    df_agg_views = df_agg[["time", "views_total", "views_unique"]]
+    df_agg_clones = df_agg[["time", "clones_total", "clones_unique"]]
 
     PANEL_WIDTH = "container"
     PANEL_HEIGHT = 200
@@ -1022,138 +1105,47 @@ def analyse_view_clones_ts_fragments() -> pd.DataFrame:
     # sync date axis range across all views/clone plots.
     x_kwargs["scale"] = alt.Scale(domain=date_axis_lim)
 
-    yaxis = alt.Axis()
-    yaxistype = symlog_or_lin(df_agg_clones, "clones_unique", 100)
-    if yaxistype == "symlog":
-        yaxis = alt.Axis(values=[1, 10, 50, 100, 500, 1000, 5000, 10000])
-    chart_clones_unique = (
-        (
-            alt.Chart(df_agg_clones)
-            .mark_line(point=True)
-            .encode(
-                alt.X(**x_kwargs),
-                alt.Y(
-                    "clones_unique",
-                    type="quantitative",
-                    title="unique clones per day",
-                    axis=yaxis,
-                    scale=alt.Scale(
-                        domain=(0, df_agg_clones["clones_unique"].max() * 1.1),
-                        zero=True,
-                        type=yaxistype,
-                    ),
-                ),
-                tooltip=[
-                    alt.Tooltip("clones_unique:Q", format=".1f", title="clones (u)"),
-                    alt.Tooltip("time:T", format="%B %e, %Y", title="date"),
-                ],
-            )
-        )
-        .configure_axisY(labelBound=True)
-        .configure_point(size=20)
-        .properties(**panel_props)
+    chart_clones_unique = _gen_views_clones_chart(
+        df_agg_clones,
+        "clones_unique",
+        df_agg_range["clones_unique"],
+        "unique clones per day",
+        "clones (u)",
+        x_kwargs,
+        panel_props,
     )
-
-    yaxis = alt.Axis()
-    yaxistype = symlog_or_lin(df_agg_clones, "clones_total", 100)
-    if yaxistype == "symlog":
-        yaxis = alt.Axis(values=[1, 10, 50, 100, 500, 1000, 5000, 10000])
-    chart_clones_total = (
-        (
-            alt.Chart(df_agg_clones)
-            .mark_line(point=True)
-            .encode(
-                alt.X(**x_kwargs),
-                alt.Y(
-                    "clones_total",
-                    type="quantitative",
-                    title="total clones per day",
-                    axis=yaxis,
-                    scale=alt.Scale(
-                        domain=(0, df_agg_clones["clones_total"].max() * 1.1),
-                        zero=True,
-                        type=yaxistype,
-                    ),
-                ),
-                tooltip=[
-                    alt.Tooltip("clones_total:Q", format=".1f", title="clones (t)"),
-                    alt.Tooltip("time:T", format="%B %e, %Y", title="date"),
-                ],
-            )
-        )
-        .configure_axisY(labelBound=True)
-        .configure_point(size=20)
-        .properties(**panel_props)
+    chart_clones_total = _gen_views_clones_chart(
+        df_agg_clones,
+        "clones_total",
+        df_agg_range["clones_total"],
+        "total clones per day",
+        "clones (t)",
+        x_kwargs,
+        panel_props,
     )
-
-    yaxis = alt.Axis()
-    yaxistype = symlog_or_lin(df_agg_views, "views_unique", 100)
-    if yaxistype == "symlog":
-        yaxis = alt.Axis(values=[1, 10, 50, 100, 500, 1000, 5000, 10000])
-    chart_views_unique = (
-        (
-            alt.Chart(df_agg_views)
-            .mark_line(point=True)
-            .encode(
-                alt.X(**x_kwargs),
-                alt.Y(
-                    "views_unique",
-                    type="quantitative",
-                    title="unique views per day",
-                    axis=yaxis,
-                    scale=alt.Scale(
-                        domain=(0, df_agg_views["views_unique"].max() * 1.1),
-                        zero=True,
-                        type=yaxistype,
-                    ),
-                ),
-                tooltip=[
-                    alt.Tooltip("views_unique:Q", format=".1f", title="views (u)"),
-                    alt.Tooltip("time:T", format="%B %e, %Y", title="date"),
-                ],
-            )
-        )
-        .configure_axisY(labelBound=True)
-        .configure_point(size=20)
-        .properties(**panel_props)
+    chart_views_unique = _gen_views_clones_chart(
+        df_agg_views,
+        "views_unique",
+        df_agg_range["views_unique"],
+        "unique views per day",
+        "views (u)",
+        x_kwargs,
+        panel_props,
     )
-
-    yaxis = alt.Axis()
-    yaxistype = symlog_or_lin(df_agg_views, "views_total", 100)
-    if yaxistype == "symlog":
-        yaxis = alt.Axis(values=[1, 10, 50, 100, 500, 1000, 5000, 10000])
-    chart_views_total = (
-        (
-            alt.Chart(df_agg_views)
-            .mark_line(point=True)
-            .encode(
-                alt.X(**x_kwargs),
-                alt.Y(
-                    "views_total",
-                    type="quantitative",
-                    title="total views per day",
-                    axis=yaxis,
-                    scale=alt.Scale(
-                        domain=(0, df_agg_views["views_total"].max() * 1.1),
-                        zero=True,
-                        type=yaxistype,
-                    ),
-                ),
-                tooltip=[
-                    alt.Tooltip("views_total:Q", format=".1f", title="views (t)"),
-                    alt.Tooltip("time:T", format="%B %e, %Y", title="date"),
-                ],
-            )
-        )
-        .configure_axisY(labelBound=True)
-        .configure_point(size=20)
-        .properties(**panel_props)
+    chart_views_total = _gen_views_clones_chart(
+        df_agg_views,
+        "views_total",
+        df_agg_range["views_total"],
+        "total views per day",
+        "views (t)",
+        x_kwargs,
+        panel_props,
     )
 
-    chart_views_unique_spec = chart_views_unique.to_json(indent=None)
-    chart_views_total_spec = chart_views_total.to_json(indent=None)
-    chart_clones_unique_spec = chart_clones_unique.to_json(indent=None)
-    chart_clones_total_spec = chart_clones_total.to_json(indent=None)
+    chart_views_unique_spec = chart_spec_json(chart_views_unique)
+    chart_views_total_spec = chart_spec_json(chart_views_total)
+    chart_clones_unique_spec = chart_spec_json(chart_clones_unique)
+    chart_clones_total_spec = chart_spec_json(chart_clones_total)
 
     MD_REPORT.write(
         textwrap.dedent(
@@ -1201,6 +1193,49 @@ def analyse_view_clones_ts_fragments() -> pd.DataFrame:
     return df_agg_for_return
 
 
+def _gen_views_clones_chart(
+    df, column, column_range, title, tooltip_title, x_kwargs, panel_props
+):
+    # Build one of the (otherwise identical) views/clones time series charts:
+    # plot `column` over time, use symlog y scale if the value range is large.
+    # `column_range` is the (precomputed) min/max of `column`, as a Series
+    # with labels "min" and "max".
+    yaxis = alt.Axis()
+    yaxistype = symlog_or_lin(
+        df, column, 100, value_range=(column_range["min"], column_range["max"])
+    )
+    if yaxistype == "symlog":
+        yaxis = alt.Axis(values=[1, 10, 50, 100, 500, 1000, 5000, 10000])
+
+    return (
+        (
+            alt.Chart(df)
+            .mark_line(point=True)
+            .encode(
+                alt.X(**x_kwargs),
+                alt.Y(
+                    column,
+                    type="quantitative",
+                    title=title,
+                    axis=yaxis,
+                    scale=alt.Scale(
+                        domain=(0, column_range["max"] * 1.1),
+                        zero=True,
+                        type=yaxistype,
+                    ),
+                ),
+                tooltip=[
+                    alt.Tooltip(f"{column}:Q", format=".1f", title=tooltip_title),
+                    alt.Tooltip("time:T", format="%B %e, %Y", title="date"),
+                ],
+            )
+        )
+        .configure_axisY(labelBound=True)
+        .configure_point(size=20)
+        .properties(**panel_props)
+    )
+
+
 def add_stargazers_section(
     df: pd.DataFrame,
     date_axis_lim: Tuple[str, str],
@@ -1256,7 +1291,7 @@ def add_stargazers_section(
         .properties(**panel_props)
     )
 
-    chart_spec = chart.to_json(indent=None)
+    chart_spec = chart_spec_json(chart)
 
     MD_REPORT.write(
         textwrap.dedent(
@@ -1341,7 +1376,7 @@ def add_fork_section(
         .properties(**panel_props)
     )
 
-    chart_spec = chart.to_json(indent=None)
+    chart_spec = chart_spec_json(chart)
 
     MD_REPORT.write(
         textwrap.dedent(
@@ -1371,17 +1406,27 @@ def add_fork_section(
     )
 
 
-def symlog_or_lin(df, colname, threshold):
+def chart_spec_json(chart) -> str:
+    # Serialize Vega-Lite spec for embedding into the report. Compared to
+    # `chart.to_json(indent=None)` this skips key sorting and emits compact
+    # separators -- the spec includes the (inline) data set, and this
+    # noticeably reduces the size of the generated report.
+    return json.dumps(chart.to_dict(), separators=(",", ":"))
+
+
+def symlog_or_lin(df, colname, threshold, value_range=None):
     # TODO: decide between 'linear' and 'symlog' axis based on the value range
-    rmin = df[colname].min()
-    rmax = df[colname].max()
-    log.info(f"df[{colname}] min: {rmin}, max: {rmax}")
+    # `value_range`: (min, max) of df[colname], if known already.
+    if value_range is None:
+        value_range = (df[colname].min(), df[colname].max())
+    rmin, rmax = value_range
+    log.info("df[%s] min: %s, max: %s", colname, rmin, rmax)
 
     if rmax - rmin > threshold:
-        log.info(f"df[{colname}]: use symlog scale, because range > {threshold}")
+        log.info("df[%s]: use symlog scale, because range > %s", colname, threshold)
         return "symlog"
 
-    log.info(f"df[{colname}]: use linear scale")
+    log.info("df[%s]: use linear scale", colname)
     return "linear"
 
 
@@ -51,8 +51,12 @@ logging.basicConfig(
 )
 
 
+# pytz' UTC tzinfo singleton. Use this instead of looking up the timezone by
+# name again and again (e.g. per fork/stargazer event).
+UTC = pytz.UTC
+
 # Get tz-aware datetime object corresponding to invocation time.
-NOW = pytz.timezone("UTC").localize(datetime.utcnow())
+NOW = UTC.localize(datetime.utcnow())
 INVOCATION_TIME_STRING = NOW.strftime("%Y-%m-%d_%H%M%S")
 
 if not os.environ.get("GHRS_GITHUB_API_TOKEN", None):
@@ -347,7 +351,7 @@ def get_forks_over_time(repo: Repository.Repository) -> pd.DataFrame:
     # via the Z suffix, i.e. Zulu time, i.e. UTC. pygithub doesn't parse that
     # timezone. That is, whereas the API returns `starred_at` in UTC, the
     # datetime obj created by pygithub is a naive one. Correct for that.
-    forktimes_aware = [pytz.timezone("UTC").localize(f.created_at) for f in forks]
+    forktimes_aware = [UTC.localize(f.created_at) for f in forks]
 
     # Create sorted pandas DatetimeIndex
     dtidx = pd.to_datetime(forktimes_aware)
@@ -395,7 +399,7 @@ def get_stars_over_time(repo: Repository.Repository) -> pd.DataFrame:
     # via the Z suffix, i.e. Zulu time, i.e. UTC. pygithub doesn't parze that
     # timezone. That is, whereas the API returns `starred_at` in UTC, the
     # datetime obj created by pygithub is a naive one. Correct for that.
-    startimes_aware = [pytz.timezone("UTC").localize(g.starred_at) for g in gazers]
+    startimes_aware = [UTC.localize(g.starred_at) for g in gazers]
 
     # Work towards a dataframe of the following shape:
     #                            star_events  stars_cumulative